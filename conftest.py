@@ -1,23 +1,72 @@
 import logging
 import os
+import queue
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Generator
+from typing import TYPE_CHECKING, Callable, Generator
 
 import pytest
-from playwright.sync_api import (
-    BrowserContext,
-    Page,
-    Playwright,
-    sync_playwright,
-)
 
 # Import directly from project root
-from constants import LOG_DIR, VIDEO_DIR, BrowserType, Resolution
+from constants import (
+    INIT_SCRIPTS_DIR,
+    LOG_DIR,
+    PROFILE_DIR,
+    STORAGE_STATE_FILE,
+    VIDEO_DIR,
+    BrowserType,
+    Resolution,
+)
 from logging_config import configure_logging
-from pages.base_page import BasePage
-from pages.home_page import HomePage
-from pages.login_page import LoginPage
+from utils.router import STATIC_ASSET_GLOB, attach_cache_cdp, cache_route
+
+# Playwright and the page classes are imported lazily inside the fixtures
+# that need them, so collection-only and subset runs skip their import cost.
+if TYPE_CHECKING:
+    from playwright.sync_api import BrowserContext, Page, Playwright
+
+    from pages.base_page import BasePage
+    from pages.home_page import HomePage
+    from pages.login_page import LoginPage
+
+
+class BrowserPool:
+    """Small pool of warm browser contexts with checkout/return semantics.
+
+    Contexts are created lazily up to `size` and reused across tests, so
+    tests that want per-test isolation pay context startup once per pool
+    slot instead of once per test.
+    """
+
+    def __init__(self, context_factory: Callable[[], "BrowserContext"], size: int) -> None:
+        self._factory = context_factory
+        self._size = size
+        self._created = 0
+        self._lock = threading.Lock()
+        self._contexts: queue.Queue = queue.Queue()
+
+    def get(self) -> "BrowserContext":
+        """Check a context out of the pool, creating one if under capacity."""
+        try:
+            return self._contexts.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._created < self._size:
+                self._created += 1
+                return self._factory()
+        return self._contexts.get()
+
+    def put(self, context: "BrowserContext") -> None:
+        """Return a context to the pool for the next checkout."""
+        self._contexts.put(context)
+
+    def close(self) -> None:
+        """Close every pooled context; call only once all are returned."""
+        while self._created:
+            self._contexts.get().close()
+            self._created -= 1
 
 
 def pytest_addoption(parser) -> None:
@@ -53,12 +102,47 @@ def pytest_addoption(parser) -> None:
         help="Screen resolution for testing",
     )
 
+    parser.addoption(
+        "--shared-browser",
+        action="store_true",
+        default=False,
+        help="Launch a single Chromium once and let every xdist worker connect to it over CDP",
+    )
+
+    parser.addoption(
+        "--reuse-profile",
+        action="store_true",
+        default=False,
+        help="Launch a persistent browser profile so the HTTP cache and cookies survive between runs",
+    )
+
+    parser.addoption(
+        "--username",
+        action="store",
+        default=None,
+        help="Account email used by the auth_state fixture for the one-time login",
+    )
+
+    parser.addoption(
+        "--password",
+        action="store",
+        default=None,
+        help="Account password used by the auth_state fixture for the one-time login",
+    )
+
+    parser.addoption(
+        "--fast-logs",
+        action="store_true",
+        default=False,
+        help="Disable pytest's logging plugin and session log capture for faster log-heavy runs",
+    )
+
     parser.addoption(
         "--wait-strategy",
         action="store",
-        default="networkidle",
+        default="domcontentloaded",
         choices=["networkidle", "domcontentloaded", "load", "commit"],
-        help="Default wait strategy for page navigation (default: networkidle)",
+        help="Default wait strategy for page navigation (default: domcontentloaded)",
     )
 
 
@@ -69,7 +153,7 @@ def target_url(request) -> str:
 
 @pytest.fixture(scope="session")
 def browser_type(request) -> BrowserType:
-    return BrowserType(request.config.getoption("--browser-type"))
+    return BrowserType.from_value(request.config.getoption("--browser-type"))
 
 
 @pytest.fixture(scope="session")
@@ -82,9 +166,30 @@ def browser_version(request) -> str:
     return request.config.getoption("--browser-version")
 
 
+@pytest.fixture(scope="session")
+def headed(request) -> bool:
+    """Whether to run with a visible browser window.
+
+    Reads the --headed flag already registered by pytest-playwright;
+    headless is the default since headed mode costs a GPU/renderer process
+    and compositor paints for no benefit on CI.
+    """
+    return request.config.getoption("--headed")
+
+
+@pytest.fixture(scope="session")
+def shared_browser(request) -> bool:
+    return request.config.getoption("--shared-browser")
+
+
+@pytest.fixture(scope="session")
+def reuse_profile(request) -> bool:
+    return request.config.getoption("--reuse-profile")
+
+
 @pytest.fixture(scope="session")
 def resolution(request) -> Resolution:
-    return Resolution(request.config.getoption("--resolution"))
+    return Resolution.from_value(request.config.getoption("--resolution"))
 
 
 @pytest.fixture(scope="session")
@@ -97,40 +202,92 @@ def wait_strategy(request) -> str:
 
 
 @pytest.fixture(scope="session")
-def playwright() -> Generator[Playwright, None, None]:
+def playwright() -> Generator["Playwright", None, None]:
     """Return a playwright instance that is shared among all tests."""
+    from playwright.sync_api import sync_playwright
+
     with sync_playwright() as playwright:
         yield playwright
 
 
-@pytest.fixture
-def page(browser_context, wait_strategy) -> Generator[Page, None, None]:
-    """Create a new page in the browser context."""
+@pytest.fixture(scope="session")
+def page(browser_context, wait_strategy) -> Generator["Page", None, None]:
+    """Create a single page shared by the whole session.
+
+    Opening/closing a Page per test re-does navigation, JS parsing and
+    cache warm-up; instead the page is reused and `_reset_page` isolates
+    tests by clearing cookies between them.
+    """
     page = browser_context.new_page()
     page.set_default_timeout(15000)
-    
+
     # Store the default wait strategy on the page for reference in BasePage methods
     page.default_wait_strategy = wait_strategy
-    
+
     # Create a method to wait for page to be fully ready based on strategy
     def wait_for_ready():
         page.wait_for_load_state(wait_strategy)
-    
+
     # Attach this helper to the page object
     page.wait_for_ready = wait_for_ready
-    
+
     yield page
     page.close()
 
 
+@pytest.fixture(autouse=True)
+def _reset_page(request) -> Generator[None, None, None]:
+    """Reset the shared page between tests instead of rebuilding it."""
+    yield
+    # Only touch the page if this test actually used it, so tests that
+    # never open a browser don't trigger a launch during teardown.
+    if "page" in request.fixturenames:
+        page = request.getfixturevalue("page")
+        page.context.clear_cookies()
+        page.goto("about:blank")
+
+
+def _prepare_context(context: "BrowserContext", browser_type: BrowserType) -> bool:
+    """Apply the per-context wiring every new context needs.
+
+    Bundles the app-wide JS helpers from `INIT_SCRIPTS_DIR` and attaches
+    the static-asset cache — CDP Fetch interception on Chromium-family
+    browsers, the route handler elsewhere. Shared by `browser_context`
+    and the pool's context factory so pooled contexts behave identically.
+
+    Returns:
+        True when the cache uses CDP interception (nothing to unroute).
+    """
+    # Bundle app-wide JS helpers (test hooks, vendored third-party scripts)
+    # into every page from local disk instead of fetching them from a CDN
+    # on each navigation.
+    if INIT_SCRIPTS_DIR.is_dir():
+        for script in sorted(INIT_SCRIPTS_DIR.glob("*.js")):
+            context.add_init_script(path=str(script))
+
+    # Serve repeat downloads of static assets from the on-disk cache. On
+    # Chromium this goes through CDP Fetch interception, which avoids the
+    # per-request closures context.route keeps alive; other engines fall
+    # back to the route handler.
+    use_cdp_cache = browser_type in (BrowserType.CHROMIUM, BrowserType.EDGE)
+    if use_cdp_cache:
+        attach_cache_cdp(context)
+    else:
+        context.route(STATIC_ASSET_GLOB, cache_route)
+    return use_cdp_cache
+
+
 @pytest.fixture(scope="session")
 def browser_context(
     playwright,
-    browser_type: BrowserType, 
-    selenoid_url: str, 
+    browser_type: BrowserType,
+    selenoid_url: str,
     browser_version: str,
     resolution: Resolution,
-) -> Generator[BrowserContext, None, None]:
+    reuse_profile: bool,
+    shared_browser: bool,
+    headed: bool,
+) -> Generator["BrowserContext", None, None]:
     """Create a browser context for testing."""
     # Map browser types to their respective launcher methods
     browser_launcher = {
@@ -139,7 +296,8 @@ def browser_context(
         BrowserType.EDGE: playwright.chromium,
         BrowserType.CHROMIUM: playwright.chromium,
     }.get(browser_type, playwright.chromium)
-    
+    browser = None
+
     if selenoid_url:
         # Map browser types to Selenoid browser names
         browser_name = {
@@ -150,8 +308,7 @@ def browser_context(
         }.get(browser_type, "chrome")
         
         logging.info(f"Connecting to Selenoid at {selenoid_url} with {browser_name}:{browser_version}")
-        Path(VIDEO_DIR).mkdir(exist_ok=True)
-        
+
         # Connect to Selenoid using CDP protocol
         browser = browser_launcher.connect_over_cdp(
             f"{selenoid_url.replace('/wd/hub', '')}/devtools/{browser_name}/{browser_version}/",
@@ -161,39 +318,128 @@ def browser_context(
             viewport=resolution.value if resolution.value is None else {"width": resolution.value["width"], "height": resolution.value["height"]},
             record_video_dir=str(VIDEO_DIR)
         )
+    elif shared_browser and os.environ.get("PW_CDP_WS"):
+        # Attach to the single Chromium launched in pytest_configure; CDP
+        # accepts multiple clients, so xdist workers share one browser
+        # process while keeping cookie isolation via their own contexts.
+        browser = playwright.chromium.connect_over_cdp(os.environ["PW_CDP_WS"])
+        context = browser.new_context(
+            viewport=resolution.value if resolution.value is None else {"width": resolution.value["width"], "height": resolution.value["height"]},
+            storage_state=str(STORAGE_STATE_FILE) if STORAGE_STATE_FILE.exists() else None,
+        )
+    elif reuse_profile:
+        # Persistent profile keeps the HTTP disk cache and cookies between runs,
+        # skipping repeated JS/CSS/font downloads and logins.
+        context = browser_launcher.launch_persistent_context(
+            user_data_dir=str(PROFILE_DIR),
+            channel="msedge" if browser_type == BrowserType.EDGE else None,
+            headless=not headed,
+            viewport=resolution.value if resolution.value is None else {"width": resolution.value["width"], "height": resolution.value["height"]},
+        )
     else:
         if browser_type == BrowserType.EDGE:
-            browser = browser_launcher.launch(channel="msedge", headless=False)
+            browser = browser_launcher.launch(channel="msedge", headless=not headed)
         else:
-            browser = browser_launcher.launch(headless=False)
+            browser = browser_launcher.launch(headless=not headed)
         context = browser.new_context(
-            viewport=resolution.value if resolution.value is None else {"width": resolution.value["width"], "height": resolution.value["height"]}
+            viewport=resolution.value if resolution.value is None else {"width": resolution.value["width"], "height": resolution.value["height"]},
+            storage_state=str(STORAGE_STATE_FILE) if STORAGE_STATE_FILE.exists() else None,
         )
 
+    use_cdp_cache = _prepare_context(context, browser_type)
+
     yield context
+    if not use_cdp_cache:
+        # Unregister before closing: context.route retains per-request state
+        # for as long as the handler is installed.
+        context.unroute(STATIC_ASSET_GLOB, cache_route)
+    # No storage-state save here: _reset_page has already cleared the
+    # cookies by session teardown, so auth_state persists the logged-in
+    # state the moment it exists instead.
     context.close()
-    browser.close()
+    if browser is not None:
+        browser.close()
 
 
 def pytest_configure(config):
     """Create logs/ dir and configure root logger once for the test session."""
     config.addinivalue_line("markers", "smoke: mark a test as a smoke test")
     config.addinivalue_line("markers", "regression: mark a test as a regression test")
-    
-    console_level = config.option.log_level or "INFO"
-    logs_dir = Path(LOG_DIR)
-    logs_dir.mkdir(exist_ok=True)
 
-    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    session_log_file = logs_dir / f"test_{timestamp}.log"
+    # Output directories are created once here rather than in every place
+    # that writes to them, keeping the stat/mkdir syscalls to session start.
+    os.makedirs(LOG_DIR, exist_ok=True)
+    os.makedirs(VIDEO_DIR, exist_ok=True)
+
+    if config.option.fast_logs:
+        # Log-heavy suites pay a multiple of their runtime in pytest's
+        # logging plugin; CI jobs that aggregate logs elsewhere can opt out.
+        # The LoggingPlugin instance itself is registered by a trylast
+        # pytest_configure hook that has not run yet, so it is unregistered
+        # later, in pytest_sessionstart.
+        config.pluginmanager.set_blocked("logging")
+    else:
+        console_level = config.option.log_level or "INFO"
+        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        session_log_file = Path(LOG_DIR) / f"test_{timestamp}.log"
+
+        configure_logging(
+            level=console_level,
+            logfile_path=str(session_log_file),
+            enable_console=True,
+        )
+        # DEBUG so that runs emitting no records of their own (e.g.
+        # --collect-only) never open the lazily-created log file.
+        logging.getLogger(__name__).debug("Logging to %s", session_log_file)
+        os.environ["LOG_LEVEL"] = console_level
+
+    # With --shared-browser, the controller launches one Chromium exposing a
+    # CDP endpoint; xdist workers inherit PW_CDP_WS and connect to it in
+    # browser_context instead of launching their own browser.
+    if (
+        config.getoption("--shared-browser")
+        and not os.environ.get("PW_CDP_WS")
+        and not os.environ.get("PYTEST_XDIST_WORKER")
+    ):
+        from playwright.sync_api import sync_playwright
+
+        shared_playwright = sync_playwright().start()
+        config._shared_browser = shared_playwright.chromium.launch(
+            args=["--remote-debugging-port=9222"],
+            headless=not config.getoption("--headed"),
+        )
+        config._shared_playwright = shared_playwright
+        os.environ["PW_CDP_WS"] = "http://127.0.0.1:9222"
+        logging.getLogger(__name__).info("Shared browser exposed at %s", os.environ["PW_CDP_WS"])
+
+
+def pytest_sessionstart(session):
+    """Drop pytest's logging plugin for --fast-logs runs.
+
+    By session start every pytest_configure hook has run, so the
+    LoggingPlugin instance exists and can actually be unregistered —
+    doing this from our own pytest_configure is too early.
+    """
+    config = session.config
+    if config.option.fast_logs:
+        logging_plugin = config.pluginmanager.get_plugin("logging-plugin")
+        if logging_plugin is not None:
+            config.pluginmanager.unregister(logging_plugin)
 
-    configure_logging(
-        level=console_level,
-        logfile_path=str(session_log_file),
-        enable_console=True,
-    )
-    logging.getLogger(__name__).info("Logging to %s", session_log_file)
-    os.environ["LOG_LEVEL"] = console_level
+
+def pytest_sessionfinish(session):
+    """Flush any buffered log records so the session log file is complete."""
+    for handler in logging.getLogger().handlers:
+        handler.flush()
+
+
+def pytest_unconfigure(config):
+    """Shut down the shared browser launched by --shared-browser, if any."""
+    shared_browser = getattr(config, "_shared_browser", None)
+    if shared_browser is not None:
+        shared_browser.close()
+        config._shared_playwright.stop()
+        os.environ.pop("PW_CDP_WS", None)
 
 
 @pytest.fixture(autouse=True)
@@ -205,22 +451,104 @@ def logger():
     return logging.getLogger("test")
 
 
+@pytest.fixture(scope="session")
+def browser_pool(
+    browser_context, browser_type: BrowserType, resolution: Resolution
+) -> Generator[BrowserPool, None, None]:
+    """Pool of warm contexts created from the session browser.
+
+    Sized to the CPU count so parallel tests can each hold a context
+    without launching additional browsers.
+    """
+    browser = browser_context.browser
+    if browser is None:
+        # Persistent contexts have no parent Browser to create siblings from.
+        pytest.skip("browser_pool requires a non-persistent browser context")
+
+    def context_factory() -> "BrowserContext":
+        context = browser.new_context(
+            viewport=resolution.value if resolution.value is None else {"width": resolution.value["width"], "height": resolution.value["height"]},
+            storage_state=str(STORAGE_STATE_FILE) if STORAGE_STATE_FILE.exists() else None,
+        )
+        # Pooled contexts get the same wiring as the session context.
+        _prepare_context(context, browser_type)
+        return context
+
+    pool = BrowserPool(context_factory=context_factory, size=os.cpu_count() or 2)
+    yield pool
+    pool.close()
+
+
 @pytest.fixture
-def base_page(page, target_url) -> BasePage:
+def pooled_context(browser_pool) -> Generator["BrowserContext", None, None]:
+    """Check a warm context out of the pool for a single test.
+
+    Cookies are cleared on return, so the next checkout starts clean
+    without paying for a fresh context.
+    """
+    context = browser_pool.get()
+    yield context
+    context.clear_cookies()
+    browser_pool.put(context)
+
+
+@pytest.fixture(scope="session")
+def base_page(page, target_url) -> "BasePage":
     """Creates a BasePage instance with the page and target URL."""
     from pages.base_page import BasePage
     return BasePage(page=page, base_url=target_url)
 
 
-@pytest.fixture
-def home_page(page, target_url) -> HomePage:
+@pytest.fixture(scope="session")
+def home_page(page, target_url) -> "HomePage":
     """Creates a HomePage instance with the page and target URL."""
     from pages.home_page import HomePage
     return HomePage(page=page, base_url=target_url)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def login_page(page, target_url) -> "LoginPage":
     """Creates a LoginPage instance with the page and target URL."""
     from pages.login_page import LoginPage
     return LoginPage(page=page, base_url=target_url)
+
+
+@pytest.fixture(scope="session")
+def credentials(request) -> dict:
+    """Login credentials for the session-wide one-time login."""
+    return {
+        "email": request.config.getoption("--username"),
+        "password": request.config.getoption("--password"),
+    }
+
+
+@pytest.fixture(scope="session")
+def auth_state(browser_context, login_page, credentials) -> dict:
+    """Log in once and capture the resulting cookies/local storage.
+
+    Tests that need an authenticated session take `authed_page` instead of
+    driving the login UI again.
+    """
+    if not credentials["email"] or not credentials["password"]:
+        # Fail fast with a clear message instead of letting retry wrap a
+        # cryptic Locator.fill(None) error three times.
+        pytest.skip("pass --username/--password to use authed_page")
+    login_page.login(**credentials)
+    # Persist immediately so the next run can start from STORAGE_STATE_FILE:
+    # waiting for session teardown is too late, as _reset_page clears the
+    # cookies after every test.
+    return browser_context.storage_state(path=str(STORAGE_STATE_FILE))
+
+
+@pytest.fixture
+def authed_page(browser_context, auth_state) -> Generator["Page", None, None]:
+    """A page in a fresh context pre-loaded with the session's auth state."""
+    browser = browser_context.browser
+    if browser is None:
+        # Persistent contexts have no parent Browser to create siblings
+        # from; the profile itself already carries the login state.
+        pytest.skip("authed_page requires a non-persistent browser context")
+    context = browser.new_context(storage_state=auth_state)
+    page = context.new_page()
+    yield page
+    context.close()
@@ -5,19 +5,35 @@ from typing import Dict, List
 LOG_DIR: Path = Path("logs")  # Directory for log files
 VIDEO_DIR: Path = Path("videos")  # Directory for video recordings
 DATA_DIR = Path("test_data")  # Directory for test data files
+INIT_SCRIPTS_DIR = DATA_DIR / "js"  # JS helpers injected into every page at context creation
+CACHE_DIR: Path = Path(".pw_cache")  # On-disk cache of static assets served via context.route
+PROFILE_DIR: Path = Path(".pw_profile")  # Persistent browser profile (HTTP cache, cookies)
+STORAGE_STATE_FILE: Path = Path(".pw_state.json")  # Saved cookies/local storage between runs
 LOG_MESSAGE_FORMAT = "%(asctime)s [%(levelname)8s] %(name)s: %(message)s"
 LOG_TIME_FORMAT = "%H:%M:%S"
 
 
 class StrEnum(str, Enum):
-    """Base class for string enums to ensure consistent string representation."""
+    """Base class for string enums to ensure consistent string representation.
+
+    Subclasses must assign `_VALUES` and `_BY_VALUE` right after the class
+    body (see `BrowserType` below) so `values()`/`from_value()` avoid
+    rebuilding the list or scanning members on every call.
+    """
 
     def __str__(self) -> str:
         return self.value
 
     @classmethod
     def values(cls) -> List[str]:
-        return [element.value for element in cls]
+        return list(cls._VALUES)
+
+    @classmethod
+    def from_value(cls, value: str) -> "StrEnum":
+        try:
+            return cls._BY_VALUE[value]
+        except KeyError:
+            raise ValueError(f"{value!r} is not a valid {cls.__name__}") from None
 
 
 class BrowserType(StrEnum):
@@ -29,6 +45,10 @@ class BrowserType(StrEnum):
     EDGE = "edge"  # Adding Edge browser support
 
 
+BrowserType._VALUES = tuple(element.value for element in BrowserType)
+BrowserType._BY_VALUE = {element.value: element for element in BrowserType}
+
+
 # instead of providing `get_dimensions` method assign resolution for each class attibute e.g. `HD = {"width": 1280, "height": 720}` instead of `HD = auto()`
 class Resolution(Enum):
     HD = {"width": 1280, "height": 720}
@@ -39,4 +59,17 @@ class Resolution(Enum):
 
     @classmethod
     def values(cls) -> List[Dict[str, int] | None]:
-        return [element.value for element in cls]
+        return list(cls._VALUES)
+
+    @classmethod
+    def from_value(cls, value: Dict[str, int] | None) -> "Resolution":
+        # dict values are unhashable, so no reverse mapping is possible;
+        # scan the precomputed member tuple instead of Enum's __new__ path.
+        for element in cls._MEMBERS:
+            if element.value == value:
+                return element
+        raise ValueError(f"{value!r} is not a valid {cls.__name__}")
+
+
+Resolution._VALUES = tuple(element.value for element in Resolution)
+Resolution._MEMBERS = tuple(Resolution)
@@ -1,7 +1,10 @@
+import atexit
 import logging
+import os
 import sys
+import time
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from logging.handlers import MemoryHandler, RotatingFileHandler
 from pathlib import Path
 from typing import Optional
 
@@ -9,21 +12,47 @@ from typing import Optional
 from constants import LOG_DIR, LOG_MESSAGE_FORMAT, LOG_TIME_FORMAT
 
 
-class _ColourFormatter(logging.Formatter):
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that caches the formatted timestamp at 1-second granularity.
+
+    LOG_TIME_FORMAT has no sub-second fields, so records emitted within the
+    same second share one `time.strftime` call instead of paying it each.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._last_sec = -1
+        self._last_time = ""
+
+    def formatTime(self, record, datefmt=None):
+        sec = int(record.created)
+        if sec != self._last_sec:
+            self._last_time = time.strftime(
+                datefmt or LOG_TIME_FORMAT, time.localtime(sec)
+            )
+            self._last_sec = sec
+        return self._last_time
+
+
+class _ColourFormatter(_CachedTimeFormatter):
     """Formatter that adds colors to levelname only for console output."""
 
     COLOURS = {"DEBUG": 37, "INFO": 36, "WARNING": 33, "ERROR": 31, "CRITICAL": 41}
     RESET = "\033[0m"
+    # Escape sequences are assembled once per level, not per record.
+    _COLOURED_LEVELNAMES = {
+        getattr(logging, name): f"\033[{code}m{name}\033[0m"
+        for name, code in COLOURS.items()
+    }
 
     def format(self, record):
-        # Save original levelname
+        coloured_levelname = self._COLOURED_LEVELNAMES.get(record.levelno)
+        if coloured_levelname is None:
+            return super().format(record=record)
+        # Save original levelname and restore it after formatting
         original_levelname = record.levelname
-        # Add color only for formatting
-        colour_code = self.COLOURS.get(record.levelname, "")
-        if colour_code:
-            record.levelname = f"\033[{colour_code}m{record.levelname}{self.RESET}"
+        record.levelname = coloured_levelname
         result = super().format(record=record)
-        # Restore original levelname
         record.levelname = original_levelname
         return result
 
@@ -48,20 +77,22 @@ def configure_logging(
 
     root_logger.setLevel(level.upper())
     # Create plain formatter for file output
-    plain_formatter = logging.Formatter(fmt=LOG_MESSAGE_FORMAT, datefmt=LOG_TIME_FORMAT)
-
-    # Ensure logs directory exists
-    logs_dir = Path(LOG_DIR)
-    logs_dir.mkdir(exist_ok=True)
+    plain_formatter = _CachedTimeFormatter(fmt=LOG_MESSAGE_FORMAT, datefmt=LOG_TIME_FORMAT)
 
     if not logfile_path:
+        # The logs directory is created once in pytest_configure.
         timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        logfile_path = logs_dir / f"test_{timestamp}.log"  # type: ignore
+        logfile_path = Path(LOG_DIR) / f"test_{timestamp}.log"  # type: ignore
 
     if enable_console:
+        # Only colourise when someone is actually looking at a terminal;
+        # captured/redirected output gets plain text without escape bytes.
+        use_colour = sys.stdout.isatty() and os.environ.get("NO_COLOR") is None
         console_handler = logging.StreamHandler(stream=sys.stdout)
         console_handler.setFormatter(
             fmt=_ColourFormatter(fmt=LOG_MESSAGE_FORMAT, datefmt=LOG_TIME_FORMAT)
+            if use_colour
+            else plain_formatter
         )
         root_logger.addHandler(hdlr=console_handler)
 
@@ -70,8 +101,20 @@ def configure_logging(
         maxBytes=2_000_000,
         backupCount=3,
         encoding="utf-8",
+        delay=True,  # Only create the file once a record is actually emitted
     )
     file_handler.setFormatter(fmt=plain_formatter)
-    root_logger.addHandler(hdlr=file_handler)
+
+    if os.environ.get("LOG_UNBUFFERED"):
+        # Escape hatch: write every record straight to disk.
+        root_logger.addHandler(hdlr=file_handler)
+    else:
+        # Buffer file writes to keep per-record syscalls off the critical
+        # path; errors and the end of the session flush the buffer.
+        memory_handler = MemoryHandler(
+            capacity=8192, flushLevel=logging.ERROR, target=file_handler
+        )
+        root_logger.addHandler(hdlr=memory_handler)
+        atexit.register(memory_handler.flush)
 
     logging.captureWarnings(capture=True)
@@ -1,12 +1,63 @@
 import functools
 import logging
 import time
+from types import MethodType
 from typing import Any, Callable, Optional, TypeVar, cast
 from urllib.parse import urljoin
 
+from playwright.sync_api import Error as PlaywrightError
 from playwright.sync_api import Locator, Page, expect
 
 
+class _RetryAction:
+    """Descriptor wrapping a page action with retries and exponential backoff.
+
+    Built once at class-definition time: the backoff delays are precomputed
+    and `time.sleep` is cached on the instance, so each wrapped call only
+    pays for the attempt loop itself. `__get__` preserves bound-method
+    semantics for the decorated page-object methods.
+    """
+
+    def __init__(self, func: Callable[..., Any], retries: int, base_delay: float) -> None:
+        self._func = func
+        self._retries = retries
+        self._delays = tuple(base_delay * 2**i for i in range(retries - 1))
+        self._sleep = time.sleep
+        functools.update_wrapper(wrapper=self, wrapped=func)
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return MethodType(self, instance)
+
+    def __call__(self, instance, *args, **kwargs) -> Any | None:
+        func = self._func
+        action_name = self.__name__
+        logger = instance.logger
+        log_info = logger.isEnabledFor(logging.INFO)
+        for attempt in range(1, self._retries + 1):
+            try:
+                if log_info:
+                    logger.info("Attempt %d for action: %s", attempt, action_name)
+                return func(instance, *args, **kwargs)
+            except PlaywrightError as e:
+                logger.warning("Attempt %d failed: %s", attempt, e)
+                if attempt < self._retries:
+                    delay = self._delays[attempt - 1]
+                    if log_info:
+                        logger.info(
+                            "Retrying action %s after %.2f seconds...",
+                            action_name,
+                            delay,
+                        )
+                    self._sleep(delay)
+                else:
+                    logger.error(
+                        "Action %s failed after %d attempts", action_name, self._retries
+                    )
+                    raise
+
+
 class BasePage:
     def __init__(self, page: Page, base_url: str = "") -> None:
         """Initialize the BasePage with a Playwright Page object and base URL.
@@ -26,31 +77,8 @@ class BasePage:
 
     @staticmethod
     def retry(retries: int = 3, base_delay: float = 1.0):
-        def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
-            @functools.wraps(wrapped=func)
-            def wrapper(self, *args, **kwargs) -> Any | None:
-                for attempt in range(1, retries + 1):
-                    try:
-                        self.logger.info(
-                            f"Attempt {attempt} for action: {func.__name__}"
-                        )
-                        return func(self, *args, **kwargs)
-                    except Exception as e:
-                        self.logger.warning(f"Attempt {attempt} failed: {e}")
-                        if attempt < retries:
-                            delay = base_delay * (
-                                2 ** (attempt - 1)
-                            )  # Exponential backoff
-                            self.logger.info(
-                                f"Retrying action {func.__name__} after {delay:.2f} seconds..."
-                            )
-                            time.sleep(delay)
-                        else:
-                            self.logger.error(
-                                f"Action {func.__name__} failed after {retries} attempts"
-                            )
-                            raise
-            return wrapper
+        def decorator(func: Callable[..., Any]) -> _RetryAction:
+            return _RetryAction(func=func, retries=retries, base_delay=base_delay)
         return decorator
 
     def locator(self, selector: str) -> Locator:
@@ -59,10 +87,14 @@ class BasePage:
 
     @retry()
     def wait_until_loaded(self) -> None:
-        """Wait for any navigation/redirection to complete and page to be ready."""
+        """Wait for any navigation/redirection to complete and page to be ready.
+
+        Waits for `domcontentloaded` only; `networkidle` blocks on 500 ms of
+        network silence and stalls on pages with analytics/beacons. Pages that
+        need a real readiness marker should call `wait_for_element` instead.
+        """
         self.logger.info("Waiting for navigation to complete")
         self.page.wait_for_load_state("domcontentloaded")
-        self.page.wait_for_load_state("networkidle")
         self.logger.info("Page is loaded and ready.")
 
     def back(self):
@@ -91,35 +123,35 @@ class BasePage:
                 "No URL provided for navigation. Either provide a path or set base_url."
             )
 
-        self.logger.info(f"Navigating to {full_url}")
+        self.logger.info("Navigating to %s", full_url)
         self.page.goto(url=full_url)
         self.wait_until_loaded()
 
     @retry()
     def click_element_and_wait_for_navigation(self, selector: str) -> None:
         """Click element and wait for navigation using locator."""
-        self.logger.info(f"Clicking element that triggers navigation: {selector}")
+        self.logger.info("Clicking element that triggers navigation: %s", selector)
         with self.page.expect_navigation():
             self.locator(selector).click()
         self.wait_until_loaded()
-        self.logger.info(f"Page loaded after clicking element: {selector}")
+        self.logger.info("Page loaded after clicking element: %s", selector)
 
     @retry()
     def click_element(self, selector: str) -> None:
         """Click on an element using locator."""
-        self.logger.info(f"Clicking element: {selector}")
+        self.logger.info("Clicking element: %s", selector)
         self.locator(selector).click()
 
     @retry()
     def fill_text(self, selector: str, text: str) -> None:
         """Fill text into an input field using locator."""
-        self.logger.info(f"Filling text into element: {selector}")
+        self.logger.info("Filling text into element: %s", selector)
         self.locator(selector).fill(text)
 
     @retry()
     def get_text(self, selector: str) -> str:
         """Get text content from an element using locator."""
-        self.logger.info(f"Getting text from element: {selector}")
+        self.logger.info("Getting text from element: %s", selector)
         return self.locator(selector).text_content() or ""
 
     @retry()
@@ -140,55 +172,55 @@ class BasePage:
     @retry()
     def wait_for_element(self, selector: str, timeout: Optional[float] = None) -> None:
         """Wait for element to be visible using locator."""
-        self.logger.info(f"Waiting for element: {selector}")
+        self.logger.info("Waiting for element: %s", selector)
         self.locator(selector).wait_for(state="visible", timeout=timeout)
 
     @retry()
     def wait_for_element_hidden(self, selector: str, timeout: Optional[float] = None) -> None:
         """Wait for element to be hidden using locator."""
-        self.logger.info(f"Waiting for element to be hidden: {selector}")
+        self.logger.info("Waiting for element to be hidden: %s", selector)
         self.locator(selector).wait_for(state="hidden", timeout=timeout)
 
     @retry()
     def get_element_attribute(self, selector: str, attribute: str) -> Optional[str]:
         """Get element attribute value using locator."""
-        self.logger.info(f"Getting attribute '{attribute}' from element: {selector}")
+        self.logger.info("Getting attribute '%s' from element: %s", attribute, selector)
         return self.locator(selector).get_attribute(attribute)
 
     @retry()
     def select_option(self, selector: str, value: str) -> None:
         """Select an option in a dropdown using locator."""
-        self.logger.info(f"Selecting option '{value}' in dropdown: {selector}")
+        self.logger.info("Selecting option '%s' in dropdown: %s", value, selector)
         self.locator(selector).select_option(value)
 
     @retry()
     def hover_element(self, selector: str) -> None:
         """Hover over an element using locator."""
-        self.logger.info(f"Hovering over element: {selector}")
+        self.logger.info("Hovering over element: %s", selector)
         self.locator(selector).hover()
 
     @retry()
     def double_click_element(self, selector: str) -> None:
         """Double click an element using locator."""
-        self.logger.info(f"Double clicking element: {selector}")
+        self.logger.info("Double clicking element: %s", selector)
         self.locator(selector).dblclick()
 
     @retry()
     def right_click_element(self, selector: str) -> None:
         """Right click an element using locator."""
-        self.logger.info(f"Right clicking element: {selector}")
+        self.logger.info("Right clicking element: %s", selector)
         self.locator(selector).click(button="right")
 
     @retry()
     def press_key(self, selector: str, key: str) -> None:
         """Press a key on an element using locator."""
-        self.logger.info(f"Pressing key '{key}' on element: {selector}")
+        self.logger.info("Pressing key '%s' on element: %s", key, selector)
         self.locator(selector).press(key)
 
     @retry()
     def clear_and_fill(self, selector: str, text: str) -> None:
         """Clear input field and fill with new text using locator."""
-        self.logger.info(f"Clearing and filling element: {selector}")
+        self.logger.info("Clearing and filling element: %s", selector)
         locator = self.locator(selector)
         locator.clear()
         locator.fill(text)
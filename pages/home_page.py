@@ -23,7 +23,7 @@ class HomePage(BasePage):
 
     def search_content(self, query: str) -> None:
         """Search for content on the page using locator."""
-        self.logger.info(f"Searching for content: {query}")
+        self.logger.info("Searching for content: %s", query)
         search_locator = self.locator(self.search_box)
         search_locator.fill(query)
         search_locator.press("Enter")
@@ -1,13 +1,18 @@
+import functools
 from urllib.parse import urljoin
 
 from pages.base_page import BasePage
 
+# urljoin re-parses both URLs on every call; the base/path pairs seen here
+# are a handful of constants, so cache the joined results.
+_join = functools.lru_cache(maxsize=64)(urljoin)
+
 
 class LoginPage(BasePage):
     def __init__(self, page, base_url: str = "") -> None:
         super().__init__(page=page, base_url=base_url)
         self.path = "/users/sign_in"
-        self.url = urljoin(base=base_url, url=self.path)
+        self.url = _join(base_url, self.path)
         
         # Element selectors
         self.email_field = "#user_email"
@@ -18,7 +23,7 @@ class LoginPage(BasePage):
 
     def input_email(self, email: str) -> None:
         """Input email into the email field using locator."""
-        self.logger.info(f"Filling in email field: {email}")
+        self.logger.info("Filling in email field: %s", email)
         self.fill_text(self.email_field, email)
 
     def input_password(self, password: str) -> None:
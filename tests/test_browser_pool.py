@@ -0,0 +1,55 @@
+from conftest import BrowserPool
+
+
+class FakeContext:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def test_pool_creates_lazily_up_to_size():
+    created = []
+
+    def factory():
+        context = FakeContext()
+        created.append(context)
+        return context
+
+    pool = BrowserPool(context_factory=factory, size=2)
+    first = pool.get()
+    second = pool.get()
+
+    assert len(created) == 2
+    assert first is not second
+
+
+def test_pool_reuses_returned_contexts():
+    created = []
+
+    def factory():
+        context = FakeContext()
+        created.append(context)
+        return context
+
+    pool = BrowserPool(context_factory=factory, size=2)
+    context = pool.get()
+    pool.put(context)
+
+    # A returned context is handed out again before a new one is created.
+    assert pool.get() is context
+    assert len(created) == 1
+
+
+def test_pool_close_closes_every_context():
+    contexts = [FakeContext(), FakeContext()]
+    pool = BrowserPool(context_factory=contexts.pop, size=2)
+
+    first = pool.get()
+    second = pool.get()
+    pool.put(first)
+    pool.put(second)
+    pool.close()
+
+    assert first.closed and second.closed
@@ -47,6 +47,16 @@ def test_login_functionality(login_page) -> None:
     # Perform login
     login_page.login("test@example.com", "password123", remember_me=True)
 
+def test_pooled_context_navigation(pooled_context, target_url) -> None:
+    """Test navigating in an isolated context checked out of the pool."""
+    page = pooled_context.new_page()
+    base_page = BasePage(page=page, base_url=target_url)
+    base_page.navigate()
+
+    # Pooled contexts carry the same wiring as the session context
+    base_page.expect_visible("body")
+    page.close()
+
 def test_search_functionality(home_page) -> None:
     """Test search functionality using locators."""
     home_page.navigate()
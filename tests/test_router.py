@@ -0,0 +1,164 @@
+import base64
+
+import pytest
+
+from utils import router
+from utils.router import _cache_path, _on_request_paused, cache_route
+
+
+class FakeCDP:
+    """Records Fetch.* commands; optionally raises for a given method."""
+
+    def __init__(self, responses=None, fail_on=None):
+        self.sent = []
+        self._responses = responses or {}
+        self._fail_on = fail_on
+
+    def send(self, method, params=None):
+        if method == self._fail_on:
+            raise RuntimeError(f"{method} failed")
+        self.sent.append((method, params))
+        return self._responses.get(method, {})
+
+    def methods(self):
+        return [method for method, _ in self.sent]
+
+
+class FakeRequest:
+    def __init__(self, url):
+        self.url = url
+
+
+class FakeResponse:
+    def __init__(self, body, ok=True):
+        self.ok = ok
+        self._body = body
+
+    def body(self):
+        return self._body
+
+
+class FakeRoute:
+    def __init__(self, fetched=None):
+        self.fulfilled_with = None
+        self._fetched = fetched
+
+    def fetch(self):
+        return self._fetched
+
+    def fulfill(self, **kwargs):
+        self.fulfilled_with = kwargs
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Point the asset cache at a per-test temporary directory."""
+    monkeypatch.setattr(router, "CACHE_DIR", tmp_path)
+    return tmp_path
+
+
+def test_cache_route_hit_serves_body_with_content_type():
+    url = "https://cdn.example.com/app.js?v=1"
+    cached = _cache_path(url)
+    cached.write_bytes(b"export default 1;")
+
+    route = FakeRoute()
+    cache_route(route, FakeRequest(url))
+
+    assert route.fulfilled_with["body"] == b"export default 1;"
+    assert route.fulfilled_with["status"] == 200
+    assert route.fulfilled_with["content_type"] == "text/javascript"
+
+
+def test_cache_route_miss_fetches_and_populates_cache():
+    url = "https://cdn.example.com/site.css"
+    response = FakeResponse(b"body { margin: 0 }")
+
+    route = FakeRoute(fetched=response)
+    cache_route(route, FakeRequest(url))
+
+    assert _cache_path(url).read_bytes() == b"body { margin: 0 }"
+    assert route.fulfilled_with == {"response": response}
+
+
+def test_request_stage_hit_fulfills_with_content_type():
+    url = "https://cdn.example.com/site.css"
+    cached = _cache_path(url)
+    cached.write_bytes(b"body { margin: 0 }")
+
+    cdp = FakeCDP()
+    _on_request_paused(cdp, {"requestId": "r1", "request": {"url": url}})
+
+    method, params = cdp.sent[0]
+    assert method == "Fetch.fulfillRequest"
+    assert params["responseCode"] == 200
+    assert {"name": "Content-Type", "value": "text/css"} in params["responseHeaders"]
+    assert base64.b64decode(params["body"]) == b"body { margin: 0 }"
+
+
+def test_request_stage_miss_continues_request():
+    cdp = FakeCDP()
+    _on_request_paused(
+        cdp, {"requestId": "r1", "request": {"url": "https://cdn.example.com/app.js"}}
+    )
+
+    assert cdp.sent == [("Fetch.continueRequest", {"requestId": "r1"})]
+
+
+def test_response_stage_miss_captures_body_and_fulfills():
+    url = "https://cdn.example.com/app.js"
+    body = base64.b64encode(b"export default 1;").decode()
+    headers = [{"name": "Content-Type", "value": "text/javascript"}]
+
+    cdp = FakeCDP(
+        responses={"Fetch.getResponseBody": {"body": body, "base64Encoded": True}}
+    )
+    _on_request_paused(
+        cdp,
+        {
+            "requestId": "r1",
+            "request": {"url": url},
+            "responseStatusCode": 200,
+            "responseHeaders": headers,
+        },
+    )
+
+    assert _cache_path(url).read_bytes() == b"export default 1;"
+    # getResponseBody drained the response, so it must be answered with
+    # fulfillRequest carrying the captured body, not continued.
+    method, params = cdp.sent[-1]
+    assert method == "Fetch.fulfillRequest"
+    assert params["responseCode"] == 200
+    assert params["responseHeaders"] == headers
+    assert params["body"] == body
+
+
+def test_response_stage_already_cached_continues_response():
+    url = "https://cdn.example.com/app.js"
+    _cache_path(url).write_bytes(b"export default 1;")
+
+    cdp = FakeCDP()
+    _on_request_paused(
+        cdp,
+        {"requestId": "r1", "request": {"url": url}, "responseStatusCode": 200},
+    )
+
+    assert cdp.sent == [("Fetch.continueResponse", {"requestId": "r1"})]
+
+
+def test_response_stage_failure_fails_request():
+    cdp = FakeCDP(fail_on="Fetch.getResponseBody")
+    _on_request_paused(
+        cdp,
+        {
+            "requestId": "r1",
+            "request": {"url": "https://cdn.example.com/app.js"},
+            "responseStatusCode": 200,
+        },
+    )
+
+    # The capture failed and the body state is unknown, so the request must
+    # be resolved — failed, not retried or left hanging.
+    assert cdp.sent == [
+        ("Fetch.failRequest", {"requestId": "r1", "errorReason": "Failed"})
+    ]
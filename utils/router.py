@@ -0,0 +1,158 @@
+import base64
+import hashlib
+from pathlib import Path
+
+# Import directly from project root
+from constants import CACHE_DIR
+
+# Asset types worth caching: immutable static files re-downloaded on every run
+# because Playwright does not persist its HTTP cache across contexts.
+STATIC_ASSET_EXTENSIONS = ("css", "js", "png", "woff2", "gif", "webp")
+STATIC_ASSET_GLOB = "**/*.{" + ",".join(STATIC_ASSET_EXTENSIONS) + "}"
+
+# CDP Fetch patterns: pause matching requests before they hit the network and
+# again once the response headers arrive, so cache misses can be captured.
+# Two patterns per type anchor the extension at the end of the path or right
+# before the query string; an open-ended `*.js*` would also match `.json`
+# API endpoints and serve stale dynamic data from the cache.
+_FETCH_PATTERNS = [
+    {"urlPattern": pattern, "requestStage": stage}
+    for ext in STATIC_ASSET_EXTENSIONS
+    for pattern in (f"*.{ext}", f"*.{ext}?*")
+    for stage in ("Request", "Response")
+]
+
+# MIME types for cache hits: browsers reject ES modules and other
+# strict-MIME resources served without a matching Content-Type.
+_CONTENT_TYPES = {
+    "css": "text/css",
+    "js": "text/javascript",
+    "png": "image/png",
+    "woff2": "font/woff2",
+    "gif": "image/gif",
+    "webp": "image/webp",
+}
+
+
+def _cache_path(url: str) -> Path:
+    """Map a URL to its on-disk cache file, keyed by an MD5 hash of the URL."""
+    bare_url = url.split("?", 1)[0]
+    return CACHE_DIR / (hashlib.md5(url.encode()).hexdigest() + "." + bare_url.rsplit(".", 1)[-1])
+
+
+def _content_type(cached: Path) -> str:
+    """Derive the Content-Type of a cache file from its extension suffix."""
+    return _CONTENT_TYPES.get(cached.suffix.lstrip("."), "application/octet-stream")
+
+
+def cache_route(route, request) -> None:
+    """Serve a static asset from the on-disk cache, fetching it on a miss.
+
+    Fallback for browsers without CDP (Firefox, WebKit); Chromium uses
+    `attach_cache_cdp` instead, since `context.route` retains per-request
+    state in Playwright's router for as long as the handler is installed.
+
+    Args:
+        route: Playwright Route to fulfill
+        request: Playwright Request being intercepted
+    """
+    cached = _cache_path(request.url)
+
+    if cached.exists():
+        route.fulfill(body=cached.read_bytes(), status=200, content_type=_content_type(cached))
+        return
+
+    response = route.fetch()
+    if response.ok:
+        CACHE_DIR.mkdir(exist_ok=True)
+        cached.write_bytes(response.body())
+    route.fulfill(response=response)
+
+
+def attach_cache_cdp(context) -> None:
+    """Intercept static assets on every page of the context via CDP Fetch.
+
+    Talks to the Chrome DevTools Protocol directly instead of going through
+    `context.route`, which keeps request closures alive in Playwright's
+    JS-side router. Cached assets are fulfilled from `CACHE_DIR` at the
+    request stage; misses are captured at the response stage.
+
+    Args:
+        context: Playwright BrowserContext to attach interception to
+    """
+    def _attach(page) -> None:
+        cdp = context.new_cdp_session(page)
+        cdp.send("Fetch.enable", {"patterns": _FETCH_PATTERNS})
+        cdp.on("Fetch.requestPaused", lambda event: _on_request_paused(cdp, event))
+
+    context.on("page", _attach)
+    for page in context.pages:
+        _attach(page)
+
+
+def _on_request_paused(cdp, event) -> None:
+    """Handle a paused Fetch request: serve from cache or capture the body."""
+    request_id = event["requestId"]
+    response_stage = event.get("responseStatusCode") is not None
+    cached = _cache_path(event["request"]["url"])
+
+    try:
+        if not response_stage:
+            # Request stage: short-circuit to the cache when possible.
+            if cached.exists():
+                cdp.send(
+                    "Fetch.fulfillRequest",
+                    {
+                        "requestId": request_id,
+                        "responseCode": 200,
+                        "responseHeaders": [
+                            {"name": "Content-Type", "value": _content_type(cached)}
+                        ],
+                        "body": base64.b64encode(cached.read_bytes()).decode(),
+                    },
+                )
+            else:
+                cdp.send("Fetch.continueRequest", {"requestId": request_id})
+        else:
+            # Response stage: populate the cache on a successful miss.
+            # Fetch.getResponseBody drains the response stream, so once the
+            # body has been read the paused request can no longer be
+            # continued — it must be answered with fulfillRequest.
+            status = event["responseStatusCode"]
+            if not cached.exists() and 200 <= status < 300:
+                body = cdp.send("Fetch.getResponseBody", {"requestId": request_id})
+                encoded = (
+                    body["body"]
+                    if body["base64Encoded"]
+                    else base64.b64encode(body["body"].encode()).decode()
+                )
+                CACHE_DIR.mkdir(exist_ok=True)
+                cached.write_bytes(base64.b64decode(encoded))
+                cdp.send(
+                    "Fetch.fulfillRequest",
+                    {
+                        "requestId": request_id,
+                        "responseCode": status,
+                        "responseHeaders": event.get("responseHeaders", []),
+                        "body": encoded,
+                    },
+                )
+            else:
+                cdp.send("Fetch.continueResponse", {"requestId": request_id})
+    except Exception:
+        # Interception must never fail the test, but the request also must
+        # not stay paused or the page hangs until its timeout. Retrying the
+        # command that just failed is pointless — and at the response stage
+        # the body may already be drained — so fail the request there and
+        # continue it at the request stage. (The CDP session itself may
+        # already be gone, hence the nested guard.)
+        try:
+            if response_stage:
+                cdp.send(
+                    "Fetch.failRequest",
+                    {"requestId": request_id, "errorReason": "Failed"},
+                )
+            else:
+                cdp.send("Fetch.continueRequest", {"requestId": request_id})
+        except Exception:
+            pass